@@ -1,6 +1,36 @@
 import os
+import sys
 from pathlib import Path
 
+# Block size for streaming chapter bodies into the combined file.
+_COPY_BLOCK = 1 << 20
+
+
+def _copy_and_count(infile, outfile):
+    """
+    Copy a binary stream to outfile in large blocks, returning the number
+    of bytes, newlines and whitespace-separated words copied.
+
+    Streaming the bytes directly keeps peak memory at one block instead
+    of one chapter and skips the utf-8 decode/encode round-trip.
+    """
+    size = 0
+    lines = 0
+    words = 0
+    in_word = False
+    while True:
+        chunk = infile.read(_COPY_BLOCK)
+        if not chunk:
+            break
+        outfile.write(chunk)
+        size += len(chunk)
+        lines += chunk.count(b"\n")
+        words += len(chunk.split())
+        if in_word and not chunk[:1].isspace():
+            words -= 1  # word continued across the block boundary
+        in_word = not chunk[-1:].isspace()
+    return size, lines, words
+
 
 def combine_markdown_files(
     directory_path=".", output_file="combined_book.txt", separator="\n\n---\n\n"
@@ -13,56 +43,85 @@ def combine_markdown_files(
         output_file: Name of the output file
         separator: Text to insert between chapters (default: horizontal rule with spacing)
     """
-    md_files = sorted(
-        Path(directory_path).glob("*.md"),
-        key=lambda f: int(
-            str(f).strip()[11:15].replace("-", "").replace(".", "").replace("m", "")
-        ),
+    # scandir hands back each entry's stat from the directory walk, so
+    # the per-chapter sizes come for free with no extra stat calls
+    with os.scandir(directory_path) as it:
+        entries = [
+            (Path(directory_path) / entry.name, entry.stat().st_size)
+            for entry in it
+            if entry.is_file() and entry.name.lower().endswith(".md")
+        ]
+
+    entries.sort(
+        key=lambda e: int(
+            str(e[0]).strip()[11:15].replace("-", "").replace(".", "").replace("m", "")
+        )
     )
-
-    print(md_files)
+    md_files = [path for path, _ in entries]
+    file_sizes = dict(entries)
 
     if not md_files:
         print(f"No .md files found in {directory_path}")
         return
 
-    print(f"Found {len(md_files)} markdown files:")
-    for f in md_files:
-        print(f"  - {f.name}")
+    # Emit the file listing in a single write rather than one print per file
+    listing = "".join(
+        f"  - {f.name} ({file_sizes[f] / 1024:.1f} KB)\n" for f in md_files
+    )
+    sys.stdout.write(
+        f"Found {len(md_files)} markdown files:\n{listing}"
+        f"\nCombining into {output_file}...\n"
+    )
 
-    print(f"\nCombining into {output_file}...")
+    # Accumulate size/line/word counts while writing so the combined file
+    # is never read back or stat'd afterwards.
+    total_bytes = 0
+    total_lines = 0
+    total_words = 0
 
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        for i, file_path in enumerate(md_files):
-            # Read the content
-            with open(file_path, "r", encoding="utf-8") as infile:
-                content = infile.read()
+    # Encode the static separator once instead of once per chapter
+    sep = separator.encode("utf-8")
 
+    # 1 MiB buffers keep the small header/separator writes off the
+    # syscall path (default binary buffering is only a few KiB)
+    with open(output_file, "wb", buffering=_COPY_BLOCK) as outfile:
+        for i, file_path in enumerate(md_files):
             # Write chapter header
-            outfile.write(f"# {file_path.name}\n\n")
-
-            # Write content
-            outfile.write(content)
+            header = f"# {file_path.name}\n\n".encode("utf-8")
+            outfile.write(header)
+            total_bytes += len(header)
+            total_lines += header.count(b"\n")
+            total_words += len(header.split())
+
+            # Stream the chapter body in blocks instead of loading it
+            # into a str and re-encoding it on write
+            with open(file_path, "rb", buffering=_COPY_BLOCK) as infile:
+                if hasattr(os, "posix_fadvise"):
+                    # Tell the kernel we read front-to-back so it can
+                    # ramp up readahead
+                    os.posix_fadvise(
+                        infile.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                    )
+                size, lines, words = _copy_and_count(infile, outfile)
+            total_bytes += size
+            total_lines += lines
+            total_words += words
 
             # Add separator between chapters (but not after the last one)
             if i < len(md_files) - 1:
-                outfile.write(separator)
+                outfile.write(sep)
+                total_bytes += len(sep)
+                total_lines += sep.count(b"\n")
+                total_words += len(sep.split())
 
-    # Get file size
-    file_size = os.path.getsize(output_file)
-    file_size_kb = file_size / 1024
+    file_size_kb = total_bytes / 1024
 
     print(f"\n✓ Successfully combined {len(md_files)} files")
     print(f"✓ Output file: {output_file}")
     print(f"✓ File size: {file_size_kb:.1f} KB")
 
-    # Count total lines and words
-    with open(output_file, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-        words = sum(len(line.split()) for line in lines)
-
-    print(f"✓ Total lines: {len(lines):,}")
-    print(f"✓ Total words: {words:,}")
+    print(f"✓ Total lines: {total_lines:,}")
+    print(f"✓ Total words: {total_words:,}")
 
 
 if __name__ == "__main__":
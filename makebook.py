@@ -4,18 +4,48 @@ Convert a directory of markdown files into a PDF book with fiction formatting.
 Each markdown file becomes a chapter starting on a new page.
 
 Requirements:
-    pip install markdown weasyprint
+    pip install markdown weasyprint pypdf
+    pip install markdown-it-py  # optional, faster markdown parsing
 
 Usage:
     python md_to_pdf.py <input_directory> <output_pdf>
     python md_to_pdf.py ./chapters book.pdf
 """
 
+import hashlib
+import io
+import json
 import os
+import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import markdown
+
+try:
+    # Noticeably faster parser; picked up automatically when installed
+    import markdown_it
+    from markdown_it import MarkdownIt
+except ImportError:
+    MarkdownIt = None
+
+from pypdf import PdfWriter
 from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+
+# Splits a filename stem into digit/non-digit runs for natural sorting
+_NAT_SPLIT = re.compile(r'(\d+)')
+
+# Rendered-HTML cache so unchanged chapters skip markdown parsing on rebuilds
+CACHE_FILE = '.makebook_cache.json'
+
+# Identifies the active parser in cache keys so switching parser or
+# upgrading it invalidates cached chapters
+if MarkdownIt is not None:
+    _PARSER_TAG = f'markdown-it-py {markdown_it.__version__}'
+else:
+    _PARSER_TAG = f'markdown {markdown.__version__}'
 
 # HTML template with fiction book styling
 HTML_TEMPLATE = """
@@ -52,7 +82,6 @@ HTML_TEMPLATE = """
             font-size: 12pt;
             line-height: 1.6;
             text-align: justify;
-            hyphens: auto;
             color: #222;
         }}
         
@@ -143,52 +172,251 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Minimal styling for --fast builds: no running headers/string-set, no
+# hyphenation, no small-caps — the features that dominate WeasyPrint's
+# text layout time.
+HTML_TEMPLATE_FAST = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        @page {{
+            size: 5.5in 8.5in;
+            margin: 0.75in 0.5in;
+
+            @bottom-center {{
+                content: counter(page);
+                font-family: 'Crimson Text', 'Georgia', serif;
+                font-size: 10pt;
+            }}
+        }}
+
+        body {{
+            font-family: 'Crimson Text', 'Georgia', serif;
+            font-size: 12pt;
+            line-height: 1.6;
+            color: #222;
+        }}
+
+        h1 {{
+            page-break-before: always;
+            text-align: center;
+            font-size: 24pt;
+            font-weight: normal;
+            margin-top: 2in;
+            margin-bottom: 1in;
+        }}
+
+        h1:first-of-type {{
+            page-break-before: avoid;
+        }}
+
+        h2 {{
+            font-size: 14pt;
+            font-weight: bold;
+            margin-top: 1.5em;
+            margin-bottom: 0.75em;
+            page-break-after: avoid;
+        }}
+
+        p {{
+            margin: 0;
+            text-indent: 1.5em;
+        }}
+
+        /* Scene breaks */
+        hr {{
+            border: none;
+            text-align: center;
+            margin: 2em 0;
+        }}
+
+        hr:after {{
+            content: "* * *";
+            letter-spacing: 1em;
+        }}
+
+        blockquote {{
+            margin: 1em 2em;
+            font-style: italic;
+        }}
+    </style>
+</head>
+<body>
+{content}
+</body>
+</html>
+"""
+
+
+def _encode_template(template):
+    """Split a page template at {content} and pre-encode both static halves."""
+    prefix, suffix = template.split('{content}')
+    return (
+        prefix.replace('{{', '{').replace('}}', '}').encode('utf-8'),
+        suffix.replace('{{', '{').replace('}}', '}').encode('utf-8'),
+    )
+
+
+# Encoded once at import so wrapping a chapter is bytes concatenation
+# instead of a full-template format + encode per chapter
+_TEMPLATE_BYTES = _encode_template(HTML_TEMPLATE)
+_TEMPLATE_FAST_BYTES = _encode_template(HTML_TEMPLATE_FAST)
+
 
 def get_chapter_files(directory):
     """Get all markdown files sorted naturally."""
-    path = Path(directory)
-    md_files = list(path.glob("*.md")) + list(path.glob("*.markdown"))
-    
+    # One directory scan instead of one glob per extension
+    with os.scandir(directory) as it:
+        md_files = [
+            Path(entry.path) for entry in it
+            if entry.is_file() and entry.name.lower().endswith(('.md', '.markdown'))
+        ]
+
     # Sort files naturally (e.g., ch1, ch2, ch10)
     def natural_sort_key(filepath):
-        import re
-        parts = re.split(r'(\d+)', filepath.stem)
+        parts = _NAT_SPLIT.split(filepath.stem)
         return [int(p) if p.isdigit() else p.lower() for p in parts]
     
     return sorted(md_files, key=natural_sort_key)
 
 
+# Per-worker Markdown instance, built once by the pool initializer so
+# extension setup is not repeated for every chapter
+_MD = None
+
+
+def _init_md():
+    """Create this worker process's reusable markdown converter."""
+    global _MD
+    if MarkdownIt is not None:
+        # breaks/typographer rules mirror the nl2br and smarty extensions
+        _MD = MarkdownIt('commonmark', {'breaks': True, 'typographer': True})
+        _MD.enable(['table', 'strikethrough', 'smartquotes', 'replacements'])
+    else:
+        _MD = markdown.Markdown(extensions=[
+            'extra',
+            'nl2br',
+            'sane_lists',
+            'smarty'
+        ])
+
+
+def _convert(content):
+    """Run this worker's parser over one chapter's source."""
+    if MarkdownIt is not None:
+        return _MD.render(content)
+    html_content = _MD.convert(content)
+    _MD.reset()
+    return html_content
+
+
+def _convert_one(content):
+    """Convert one chapter's markdown source to HTML in a worker process."""
+    if _MD is None:
+        _init_md()
+
+    return _convert(content)
+
+
+def _load_cache():
+    """Load the rendered-HTML cache, or an empty one if missing/corrupt."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
 def markdown_to_html(md_files):
-    """Convert markdown files to HTML chapters."""
-    md = markdown.Markdown(extensions=[
-        'extra',
-        'nl2br',
-        'sane_lists',
-        'smarty'
-    ])
-    
-    chapters_html = []
-    
-    for i, md_file in enumerate(md_files, 1):
+    """Convert markdown files to a list of per-chapter HTML fragments,
+    reusing cached output for unchanged chapters and converting the rest
+    in parallel."""
+    cache = _load_cache()
+
+    chapters_html = [None] * len(md_files)
+    keys = [None] * len(md_files)
+    pending = []
+
+    for idx, md_file in enumerate(md_files):
         with open(md_file, 'r', encoding='utf-8') as f:
             content = f.read()
-        
-        # Convert markdown to HTML
-        html_content = md.convert(content)
-        
-        # If no h1 heading exists, add chapter title
+
+        # Key on source content and the active parser so edits, library
+        # upgrades and parser switches all invalidate the entry
+        key = hashlib.sha1(
+            f'{_PARSER_TAG}\n{content}'.encode('utf-8')
+        ).hexdigest()
+        keys[idx] = key
+
+        if key in cache:
+            chapters_html[idx] = cache[key]
+        else:
+            pending.append((idx, content))
+
+    if pending:
+        # md.convert is pure-Python CPU work, so chapters convert in worker
+        # processes; map preserves chapter order.
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=_init_md
+        ) as executor:
+            results = executor.map(_convert_one, (content for _, content in pending))
+            for (idx, _), html_content in zip(pending, results):
+                chapters_html[idx] = html_content
+
+    # Persist only the current chapters, dropping stale entries. The cache
+    # holds raw converter output only — the fallback heading below depends
+    # on chapter position and filename, which are not part of the key.
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(dict(zip(keys, chapters_html)), f)
+
+    # If no h1 heading exists, add chapter title
+    for idx, md_file in enumerate(md_files):
+        html_content = chapters_html[idx]
         if '<h1>' not in html_content:
             chapter_title = md_file.stem.replace('_', ' ').replace('-', ' ').title()
-            html_content = f'<h1>Chapter {i}: {chapter_title}</h1>\n{html_content}'
-        
-        chapters_html.append(html_content)
-        md.reset()
-    
-    return '\n\n'.join(chapters_html)
+            chapters_html[idx] = (
+                f'<h1>Chapter {idx + 1}: {chapter_title}</h1>\n{html_content}'
+            )
+
+    return chapters_html
+
 
+# Per-worker FontConfiguration so the fontconfig lookup for the body
+# font family happens once per worker, not once per chapter
+_FONT_CONFIG = None
 
-def create_pdf(input_dir, output_pdf):
-    """Create PDF book from markdown files."""
+
+def _get_font_config():
+    global _FONT_CONFIG
+    if _FONT_CONFIG is None:
+        _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
+
+def _render_chapter_pdf(task):
+    """Render one chapter's wrapped HTML to a standalone PDF in a worker process."""
+    full_html, base_url, out_path, hyphenate = task
+    font_config = _get_font_config()
+    # Hyphenation makes Pango try breaks inside every word during
+    # justification, so it is opt-in via --hyphenate
+    stylesheets = None
+    if hyphenate:
+        stylesheets = [CSS(string='body { hyphens: auto }', font_config=font_config)]
+    HTML(file_obj=io.BytesIO(full_html), base_url=base_url).write_pdf(
+        out_path, stylesheets=stylesheets, font_config=font_config
+    )
+    return out_path
+
+
+def create_pdf(input_dir, output_pdf, fast=False, hyphenate=False):
+    """Create PDF book from markdown files.
+
+    Chapters are laid out as independent PDFs in parallel and merged,
+    since WeasyPrint itself is single-threaded. Trade-off: the page
+    counter restarts at each chapter.
+    """
     print(f"📚 Converting markdown files from '{input_dir}' to PDF...")
     
     # Get all chapter files
@@ -204,14 +432,29 @@ def create_pdf(input_dir, output_pdf):
     
     # Convert to HTML
     print("\n🔄 Converting markdown to HTML...")
-    content_html = markdown_to_html(md_files)
-    
-    # Create complete HTML
-    full_html = HTML_TEMPLATE.format(content=content_html)
-    
+    chapters_html = markdown_to_html(md_files)
+
     # Generate PDF
     print("📄 Generating PDF...")
-    HTML(string=full_html).write_pdf(output_pdf)
+    prefix, suffix = _TEMPLATE_FAST_BYTES if fast else _TEMPLATE_BYTES
+    base_url = os.path.abspath(input_dir)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tasks = [
+            (prefix + chapter_html.encode('utf-8') + suffix, base_url,
+             os.path.join(tmpdir, f'ch-{i:04d}.pdf'), hyphenate)
+            for i, chapter_html in enumerate(chapters_html)
+        ]
+
+        # Each chapter lays out on its own core, then the resulting PDFs
+        # are concatenated in order
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            chapter_pdfs = list(executor.map(_render_chapter_pdf, tasks))
+
+        writer = PdfWriter()
+        for chapter_pdf in chapter_pdfs:
+            writer.append(chapter_pdf)
+        writer.write(output_pdf)
     
     print(f"✅ PDF book created successfully: {output_pdf}")
     
@@ -221,13 +464,17 @@ def create_pdf(input_dir, output_pdf):
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python md_to_pdf.py <input_directory> <output_pdf>")
+    fast = '--fast' in sys.argv[1:]
+    hyphenate = '--hyphenate' in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a not in ('--fast', '--hyphenate')]
+
+    if len(args) < 2:
+        print("Usage: python md_to_pdf.py <input_directory> <output_pdf> [--fast] [--hyphenate]")
         print("Example: python md_to_pdf.py ./chapters my_book.pdf")
         sys.exit(1)
-    
-    input_dir = sys.argv[1]
-    output_pdf = sys.argv[2]
+
+    input_dir = args[0]
+    output_pdf = args[1]
     
     if not os.path.isdir(input_dir):
         print(f"❌ Error: '{input_dir}' is not a directory")
@@ -236,7 +483,7 @@ def main():
     if not output_pdf.endswith('.pdf'):
         output_pdf += '.pdf'
     
-    create_pdf(input_dir, output_pdf)
+    create_pdf(input_dir, output_pdf, fast=fast, hyphenate=hyphenate)
 
 
 if __name__ == "__main__":